@@ -0,0 +1,26 @@
+"""Optional native build.
+
+Set ``SSH_MANAGER_MYPYC=1`` to compile the ssh config parser and builder with
+mypyc (requires ``mypy`` in the build environment, e.g. ``pip install mypy``
+and ``pip install --no-build-isolation .``). Without it this is a plain
+pure-Python setuptools build driven by ``pyproject.toml``.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("SSH_MANAGER_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            # Only the compiled modules need to type-check cleanly.
+            "--follow-imports=silent",
+            "ssh_manager/ssh_config/parser.py",
+            "ssh_manager/ssh_config/builder.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
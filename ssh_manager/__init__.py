@@ -1,6 +1,20 @@
 """ssh-manager package public API."""
 
 from ssh_manager.__about__ import __version__
-from ssh_manager.ssh_manager import SSHManager
 
 __all__ = ["SSHManager", "__version__"]
+
+
+def __getattr__(name: str):
+    # Importing SSHManager pulls in GitPython and the config backend, so defer
+    # it until the attribute is first accessed (PEP 562).
+    if name == "SSHManager":
+        from ssh_manager.ssh_manager import SSHManager
+
+        globals()["SSHManager"] = SSHManager
+        return SSHManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+"""Command-line interface for ssh-manager."""
+
+from ssh_manager.cli._app import app
+
+__all__ = ["app"]
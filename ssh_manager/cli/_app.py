@@ -0,0 +1,127 @@
+"""Root Typer application for ssh-manager.
+
+Subcommands live in sibling modules and are only imported when click resolves
+them, so a single invocation loads just the command it runs.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import stat
+from pathlib import Path
+from typing import Any, List, Optional
+
+import typer
+from typer.core import TyperGroup
+
+from ssh_manager.cli._common import CLIContext
+from ssh_manager.utils import paths
+
+# Subcommand name -> True for Typer groups, False for single commands. The
+# order here is the order shown in --help.
+_LAZY_SUBCOMMANDS = {
+    "add": False,
+    "remove": False,
+    "flush": False,
+    "pull": False,
+    "check": False,
+    "local": True,
+    "remote": True,
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports ``ssh_manager.cli.<name>`` on first lookup."""
+
+    # ``ctx`` is a click Context. Newer typer vendors click, so there is no
+    # import path for it that works with every supported typer version.
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        registered = super().list_commands(ctx)
+        return list(_LAZY_SUBCOMMANDS) + [name for name in registered if name not in _LAZY_SUBCOMMANDS]
+
+    def get_command(self, ctx: Any, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in _LAZY_SUBCOMMANDS:
+            return command
+        module = importlib.import_module(f"ssh_manager.cli.{cmd_name}")
+        if _LAZY_SUBCOMMANDS[cmd_name]:
+            command = typer.main.get_group(module.app)
+        else:
+            command = typer.main.get_command(module.app)
+        self.add_command(command, cmd_name)
+        return command
+
+
+app = typer.Typer(
+    name="ssh-manager",
+    cls=LazyGroup,
+    no_args_is_help=True,
+    help="Manage local SSH config alongside a remote key repository.",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_config_path_cached(config: Optional[str]) -> Path:
+    if config is None:
+        candidate = os.path.join(paths.DATA_ROOT, "config.json")
+    else:
+        candidate = os.path.expanduser(str(paths.expand_data_root(config)))
+    # os.path.join keeps absolute candidates as-is; realpath resolves symlinks
+    # the same way Path.resolve() does without building intermediate Paths.
+    return Path(os.path.realpath(os.path.join(paths.DATA_ROOT, candidate)))
+
+
+def _resolve_config_path(config: Optional[Path]) -> Path:
+    # Path.resolve() stats every component; the layout under DATA_ROOT does
+    # not change within one invocation, so memoize on the string form.
+    return _resolve_config_path_cached(None if config is None else str(config))
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    config: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to the ssh-manager config.json file (defaults to DATA_ROOT/config.json).",
+        dir_okay=False,
+        exists=False,
+        readable=True,
+    ),
+    auto_pull: bool = typer.Option(
+        False,
+        "--auto-pull",
+        help="Automatically pull remote repo if remote config is missing.",
+    ),
+):
+    resolved = _resolve_config_path(config)
+    try:
+        is_file = stat.S_ISREG(os.stat(resolved).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
+        typer.echo(
+            f"Config file not found at {resolved}. Provide --config or create it first.",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    cli_ctx = CLIContext(
+        config_path=resolved,
+        remote_loaded=False,
+    )
+
+    if auto_pull:
+        manager = cli_ctx.manager
+        try:
+            manager.pull_ssh_key_repo()
+            cli_ctx.remote_loaded = True
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Auto-pull failed: {exc}", err=True)
+            raise typer.Exit(code=1)
+
+    ctx.obj = cli_ctx
@@ -0,0 +1,337 @@
+"""Shared state and helpers for the ssh-manager CLI commands."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import typer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from rich.console import Console, JustifyMethod
+    from rich.table import Table
+    from rich.text import Text
+
+    from ssh_manager.ssh_config.builder import SSHHostConfig
+    from ssh_manager.ssh_manager import SSHManager
+
+
+def _dumps_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _echo_json(payload: Any) -> None:
+    """Write ``payload`` as indented JSON straight to the stdout byte buffer."""
+    data = _dumps_json(payload) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _is_ascii(payload: Any) -> bool:
+    if isinstance(payload, str):
+        return payload.isascii()
+    if isinstance(payload, dict):
+        return all(_is_ascii(key) and _is_ascii(value) for key, value in payload.items())
+    if isinstance(payload, list):
+        return all(_is_ascii(item) for item in payload)
+    return True
+
+
+def _json_text(payload: Any) -> Text:
+    """Highlighted JSON like ``rich.json.JSON.from_data(indent=2, ensure_ascii=True)``."""
+    from rich.highlighter import JSONHighlighter
+
+    # orjson never escapes non-ASCII, so it only matches on ASCII-only data.
+    if orjson is not None and _is_ascii(payload):
+        text = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("ascii")
+    else:
+        text = json.dumps(payload, indent=2, ensure_ascii=True)
+    rendered = JSONHighlighter()(text)
+    rendered.no_wrap = True
+    rendered.overflow = None
+    return rendered
+
+
+def _echo(message: str) -> None:
+    """Print a plain status line, skipping click's echo machinery."""
+    sys.stdout.write(f"{message}\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+@dataclass
+class CLIContext:
+    config_path: Path
+    remote_loaded: bool = False
+    _manager: Optional[SSHManager] = field(default=None, init=False, repr=False)
+    _current_configs: Optional[List[SSHHostConfig]] = field(default=None, init=False, repr=False)
+    _name_index: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    _names_sorted: Optional[List[str]] = field(default=None, init=False, repr=False)
+
+    @property
+    def manager(self) -> SSHManager:
+        # Built on first access: it pulls in GitPython, and a command that
+        # fails argument parsing or only prints --help never needs it.
+        if self._manager is None:
+            from ssh_manager.ssh_manager import SSHManager
+
+            try:
+                self._manager = SSHManager(str(self.config_path))
+            except Exception as exc:  # pragma: no cover - defensive
+                typer.echo(f"Failed to load config: {exc}", err=True)
+                raise typer.Exit(code=2)
+        return self._manager
+
+    @property
+    def current_configs(self) -> List[SSHHostConfig]:
+        # Parsed on first access so commands that never touch the local ssh
+        # config (pull, check, remote ...) skip reading it entirely.
+        if self._current_configs is None:
+            manager = self.manager
+            try:
+                self._current_configs = _load_current_configs(manager)
+            except Exception as exc:  # pragma: no cover - defensive
+                typer.echo(f"Failed to parse current ssh config: {exc}", err=True)
+                raise typer.Exit(code=1)
+        return self._current_configs
+
+    @property
+    def name_index(self) -> Dict[str, int]:
+        # Maps host name to its position in current_configs. The first entry
+        # wins on duplicate names, matching a front-to-back scan.
+        if self._name_index is None:
+            index: Dict[str, int] = {}
+            for idx, cfg in enumerate(self.current_configs):
+                if cfg.name is not None:
+                    index.setdefault(cfg.name, idx)
+            self._name_index = index
+        return self._name_index
+
+    def insert_config(self, cfg: SSHHostConfig) -> None:
+        """Insert ``cfg`` into current_configs, keeping it sorted by name."""
+        configs = self.current_configs
+        if self._names_sorted is None:
+            self._names_sorted = [c.name or "" for c in configs]
+        name = cfg.name or ""
+        # bisect_right keeps the placement of the stable sort it replaces.
+        pos = bisect.bisect_right(self._names_sorted, name)
+        configs.insert(pos, cfg)
+        self._names_sorted.insert(pos, name)
+        self._name_index = None
+
+    def remove_config(self, idx: int) -> None:
+        del self.current_configs[idx]
+        if self._names_sorted is not None:
+            del self._names_sorted[idx]
+        self._name_index = None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern_cached(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+_ANCHORED_LITERAL_RE = re.compile(r"\^([A-Za-z0-9_\-]+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _literal_prefix(pattern: re.Pattern[str]) -> str:
+    """Literal text every name matching the ``^``-anchored ``pattern`` starts with.
+
+    Conservative: returns "" for alternations and for patterns whose flags
+    could change what the literal matches.
+    """
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE) or "|" in pattern.pattern:
+        return ""
+    match = _ANCHORED_LITERAL_RE.match(pattern.pattern)
+    if not match:
+        return ""
+    prefix = match.group(1)
+    # A quantifier applies to the last literal character only (``^ab*``).
+    if pattern.pattern[match.end() : match.end() + 1] in ("*", "?", "+", "{"):
+        prefix = prefix[:-1]
+    return prefix
+
+
+# Every other character is literal in a regex compiled without re.VERBOSE
+# (inline flags need "(", so they are covered too).
+_REGEX_METACHARS = frozenset("\\^$.*+?()[]{}|")
+
+
+def _fast_name_matcher(pattern: re.Pattern[str]) -> Optional[Callable[[str], object]]:
+    """Predicate equivalent to ``pattern.search`` built on str methods, if any.
+
+    Plain-text patterns become a substring test and anchored ones are
+    pre-filtered with startswith. Returns None when neither applies.
+    """
+    text = pattern.pattern
+    if not pattern.flags & (re.IGNORECASE | re.VERBOSE) and _REGEX_METACHARS.isdisjoint(text):
+        return lambda name: text in name
+    prefix = _literal_prefix(pattern)
+    if not prefix:
+        return None
+    search = pattern.search
+    return lambda name: name.startswith(prefix) and search(name)
+
+
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+def _scope_global_flags(pattern: str) -> str:
+    # "(?i)abc" would apply to every alternative once joined; "(?i:abc)" doesn't.
+    flags = ""
+    end = 0
+    while True:
+        match = _GLOBAL_FLAGS_RE.match(pattern, end)
+        if not match:
+            break
+        flags += match.group(1)
+        end = match.end()
+    if not flags:
+        return pattern
+    return f"(?{flags}:{pattern[end:]})"
+
+
+def _join_patterns(compiled: List[re.Pattern[str]]) -> Optional[re.Pattern[str]]:
+    """One alternation that matches wherever any of ``compiled`` does, if possible."""
+    # Group numbers shift in a join, so at most one pattern may have groups,
+    # and it goes first where its numbering is unchanged.
+    grouped = [pattern for pattern in compiled if pattern.groups]
+    if len(grouped) > 1:
+        return None
+    ordered = grouped + [pattern for pattern in compiled if not pattern.groups]
+    try:
+        return _compile_pattern_cached("|".join(_scope_global_flags(p.pattern) for p in ordered))
+    except re.error:  # e.g. a (?x) comment that would swallow the closing ")"
+        return None
+
+
+def _name_matcher(pattern: re.Pattern[str]) -> Callable[[str], object]:
+    return _fast_name_matcher(pattern) or pattern.search
+
+
+def _compile_name_filter(patterns: Optional[Sequence[str]]) -> Optional[Callable[[str], object]]:
+    """Compile the ``--pattern`` values into a predicate matching if any of them does."""
+    patterns = [pattern for pattern in patterns or () if pattern]
+    if not patterns:
+        return None
+    try:
+        compiled = [_compile_pattern_cached(pattern) for pattern in patterns]
+    except re.error as exc:
+        raise typer.BadParameter(f"Invalid regex pattern: {exc}")
+    if len(compiled) == 1:
+        return _name_matcher(compiled[0])
+    # Alternation binds loosest, so a join is the union of the patterns and
+    # runs the regex engine once per name; otherwise test them one by one.
+    joined = _join_patterns(compiled)
+    if joined is not None:
+        return _name_matcher(joined)
+    matchers = [_name_matcher(pattern) for pattern in compiled]
+    return lambda name: any(matcher(name) for matcher in matchers)
+
+
+def _load_current_configs(manager: SSHManager) -> List[SSHHostConfig]:
+    configs = manager.parse_current_ssh_config()
+    configs.sort(key=lambda cfg: cfg.name or "")
+    return configs
+
+
+def _get_context(ctx: typer.Context) -> CLIContext:
+    cli_ctx: CLIContext = ctx.obj  # type: ignore[assignment]
+    if cli_ctx is None:
+        typer.echo("CLI context was not initialized; this is unexpected.")
+        raise typer.Exit(code=1)
+    return cli_ctx
+
+
+def _ensure_remote_loaded(ctx: typer.Context) -> None:
+    cli_ctx = _get_context(ctx)
+    if cli_ctx.remote_loaded:
+        return
+    manager = cli_ctx.manager
+    try:
+        manager.read_ssh_key_repo_config()
+    except FileNotFoundError:
+        typer.echo(
+            "Remote repository config not found. Run 'ssh-manager pull' to clone/sync it first.",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+    except ValueError as exc:  # json and orjson decode errors
+        typer.echo(
+            f"Remote repository config is not valid JSON: {exc}. Run 'ssh-manager pull' to resync it.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    except Exception as exc:  # pragma: no cover - defensive
+        typer.echo(f"Failed to read remote repository config: {exc}", err=True)
+        raise typer.Exit(code=1)
+    cli_ctx.remote_loaded = True
+
+
+# Shared column layouts: (header, justify, style).
+_Column = Tuple[str, "JustifyMethod", Optional[str]]
+_INDEX_COLUMN: _Column = ("index", "right", "cyan")
+
+
+def _build_table(columns: Sequence[_Column], rows: Iterable[Sequence[str]]) -> Table:
+    """Build a rich table from fully materialized row tuples."""
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold")
+    for header, justify, style in columns:
+        table.add_column(header, justify=justify, style=style)
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _render_endpoint_table(endpoints: List[Dict]) -> Table:
+    rows = [
+        (
+            str(idx),
+            str(endpoint.get("HostName", "")),
+            str(endpoint.get("Port", "")),
+            endpoint.get("Comment", "") or "",
+        )
+        for idx, endpoint in enumerate(endpoints)
+    ]
+    columns = [_INDEX_COLUMN, ("HostName", "left", None), ("Port", "left", None), ("Comment", "left", None)]
+    return _build_table(columns, rows)
+
+
+def _render_auth_table(auths: List[Dict]) -> Table:
+    rows = [
+        (
+            str(idx),
+            auth.get("User", "") or "",
+            auth.get("IdentityFile", "") or "",
+            auth.get("Comment", "") or "",
+        )
+        for idx, auth in enumerate(auths)
+    ]
+    columns = [_INDEX_COLUMN, ("User", "left", None), ("IdentityFile", "left", None), ("Comment", "left", None)]
+    return _build_table(columns, rows)
@@ -0,0 +1,117 @@
+"""``ssh-manager add``: add a host from the remote repo to the local ssh config."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import typer
+
+from ssh_manager.cli._common import (
+    _console,
+    _echo,
+    _ensure_remote_loaded,
+    _get_context,
+    _render_auth_table,
+    _render_endpoint_table,
+)
+
+app = typer.Typer(add_completion=False)
+
+
+def _choose_index(
+    label: str,
+    options: List[Dict],
+    provided: Optional[int],
+    non_interactive: bool,
+    config_name: str,
+) -> int:
+    if not options:
+        typer.echo(f"Config '{config_name}' has no {label.lower()} options.", err=True)
+        raise typer.Exit(code=1)
+    if provided is not None:
+        if provided < 0 or provided >= len(options):
+            raise typer.BadParameter(
+                f"{label} index out of range. Valid range: 0-{len(options) - 1}."
+            )
+        return provided
+    if len(options) == 1:
+        return 0
+    if non_interactive:
+        typer.echo(
+            f"Multiple {label.lower()} options for '{config_name}'. "
+            "Use --endpoint-id/--auth-id or run 'ssh-manager remote show' to inspect choices.",
+            err=True,
+        )
+        raise typer.Exit(code=2)
+
+    console = _console()
+    console.print(f"Select {label} for '{config_name}':")
+    console.print(_render_endpoint_table(options) if label == "Endpoint" else _render_auth_table(options))
+    selection = typer.prompt(f"Enter {label} index", default="0")
+    try:
+        idx = int(selection)
+    except ValueError as exc:
+        raise typer.BadParameter(f"{label} index must be an integer") from exc
+    if idx < 0 or idx >= len(options):
+        raise typer.BadParameter(
+            f"{label} index out of range. Valid range: 0-{len(options) - 1}."
+        )
+    return idx
+
+
+@app.command()
+def add(
+    ctx: typer.Context,
+    config_name: str = typer.Argument(..., help="Remote config name to add locally."),
+    endpoint_id: Optional[int] = typer.Option(
+        None,
+        "--endpoint-id",
+        help="Endpoint index to use (see remote show).",
+    ),
+    auth_id: Optional[int] = typer.Option(
+        None,
+        "--auth-id",
+        help="Authentication index to use (see remote show).",
+    ),
+    non_interactive: bool = typer.Option(
+        False,
+        "--non-interactive",
+        help="Fail instead of prompting when multiple choices exist.",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without writing files."),
+):
+    _ensure_remote_loaded(ctx)
+    cli_ctx = _get_context(ctx)
+
+    if config_name in cli_ctx.name_index:
+        typer.echo(f"Config '{config_name}' already exists locally.", err=True)
+        raise typer.Exit(code=1)
+
+    config = cli_ctx.manager.get_ssh_key_repo_config().get(config_name)
+    if config is None:
+        typer.echo(
+            f"Config '{config_name}' not found in remote repo. Run 'ssh-manager remote list' to see available names.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    endpoints = config.get("Endpoint", [])
+    auths = config.get("Authentication", [])
+
+    selected_endpoint = _choose_index("Endpoint", endpoints, endpoint_id, non_interactive, config_name)
+    selected_auth = _choose_index("Authentication", auths, auth_id, non_interactive, config_name)
+
+    new_cfg = cli_ctx.manager.generate_ssh_config(
+        server_name=config_name, endpoint_id=selected_endpoint, auth_id=selected_auth
+    )
+
+    if dry_run:
+        console = _console()
+        console.print("Dry run: showing generated host block")
+        console.print(new_cfg.to_string(0))
+        return
+
+    cli_ctx.manager.copy_identify_file(new_cfg)
+    cli_ctx.insert_config(new_cfg)
+    cli_ctx.manager.write_ssh_config(cli_ctx.current_configs, backup=True)
+    _echo(f"Added '{config_name}' to ssh config.")
@@ -0,0 +1,17 @@
+"""``ssh-manager check``: validate the remote key repository config."""
+
+from __future__ import annotations
+
+import typer
+
+from ssh_manager.cli._common import _get_context
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def check(ctx: typer.Context):
+    cli_ctx = _get_context(ctx)
+    ok = cli_ctx.manager.check_ssh_key_repo_config()
+    if not ok:
+        raise typer.Exit(code=1)
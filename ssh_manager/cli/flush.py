@@ -0,0 +1,27 @@
+"""``ssh-manager flush``: rewrite the ssh config from the in-memory host list."""
+
+from __future__ import annotations
+
+import typer
+
+from ssh_manager.cli._common import _echo, _get_context
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def flush(
+    ctx: typer.Context,
+    backup: bool = typer.Option(
+        True,
+        "--backup/--no-backup",
+        help="Create timestamped backup before replacing ssh config.",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without writing files."),
+):
+    cli_ctx = _get_context(ctx)
+    if dry_run:
+        _echo("Dry run: would rewrite ssh config with current in-memory hosts.")
+        return
+    cli_ctx.manager.write_ssh_config(cli_ctx.current_configs, backup=backup)
+    _echo("Flushed ssh config with atomic write.")
@@ -0,0 +1,95 @@
+"""``ssh-manager local`` commands for inspecting the local ssh config."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+import typer
+
+from ssh_manager.cli._common import (
+    _INDEX_COLUMN,
+    _build_table,
+    _compile_name_filter,
+    _console,
+    _echo_json,
+    _get_context,
+)
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+    from ssh_manager.ssh_config.builder import SSHHostConfig
+
+app = typer.Typer(
+    name="local", no_args_is_help=True, help="Inspect local ssh config", add_completion=False
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_summary(
+    hostname: Optional[str], port: Optional[int], user: Optional[str], identity_file: Optional[str]
+) -> str:
+    parts: List[str] = []
+    if hostname:
+        parts.append(f"{hostname}:{port}" if port else hostname)
+    if user:
+        parts.append(f"user={user}")
+    if identity_file:
+        parts.append(f"id={identity_file}")
+    return ", ".join(parts) if parts else "-"
+
+
+def _summarize_host(cfg: SSHHostConfig) -> str:
+    # Keyed on the rendered fields rather than the object, so edits to a
+    # host can never serve a stale summary.
+    endpoint = cfg.endpoint
+    auth = cfg.authentication
+    hostname, port = (endpoint.hostname, endpoint.port) if endpoint is not None else (None, None)
+    user, identity_file = (auth.user, auth.identity_file) if auth is not None else (None, None)
+    return _build_summary(hostname, port, user, identity_file)
+
+
+def _filter_host_configs(
+    configs: List[SSHHostConfig], matcher: Optional[Callable[[str], object]]
+) -> List[SSHHostConfig]:
+    if matcher is None:
+        return configs
+    return [cfg for cfg in configs if cfg.name and matcher(cfg.name)]
+
+
+@app.command("list")
+def list_local(
+    ctx: typer.Context,
+    pattern: Optional[List[str]] = typer.Option(
+        None,
+        "--pattern",
+        "-p",
+        help="Regex to search host names (re.search); repeat to match any.",
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show full host blocks."),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON for scripting."),
+):
+    cli_ctx = _get_context(ctx)
+    matcher = _compile_name_filter(pattern)
+    configs = _filter_host_configs(cli_ctx.current_configs, matcher)
+
+    if json_output:
+        payload = [cfg.to_dict() for cfg in configs]
+        _echo_json(payload)
+        return
+
+    console = _console()
+    rows = [(str(idx), cfg.name or "", _summarize_host(cfg)) for idx, cfg in enumerate(configs)]
+    console.print(_build_table([_INDEX_COLUMN, ("name", "left", None), ("summary", "left", None)], rows))
+
+    if verbose:
+        from rich.console import Group
+        from rich.rule import Rule
+
+        # One render pass for every host instead of a rule and a print each.
+        renderables: List[RenderableType] = []
+        for cfg in configs:
+            renderables.append(Rule(cfg.name or ""))
+            renderables.append(cfg.to_string(0))
+        console.print(Group(*renderables))
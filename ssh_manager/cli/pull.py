@@ -0,0 +1,23 @@
+"""``ssh-manager pull``: clone or sync the remote key repository."""
+
+from __future__ import annotations
+
+import typer
+
+from ssh_manager.cli._common import _echo, _get_context
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def pull(ctx: typer.Context):
+    cli_ctx = _get_context(ctx)
+    manager = cli_ctx.manager
+    try:
+        # pull_ssh_key_repo() already re-reads the repo's config.json.
+        manager.pull_ssh_key_repo()
+        cli_ctx.remote_loaded = True
+    except Exception as exc:  # pragma: no cover - defensive
+        typer.echo(f"Failed to pull remote repo: {exc}", err=True)
+        raise typer.Exit(code=1)
+    _echo("Pulled remote ssh key repository.")
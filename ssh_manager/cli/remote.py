@@ -0,0 +1,113 @@
+"""``ssh-manager remote`` commands for inspecting the remote key repository."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+import typer
+
+from ssh_manager.cli._common import (
+    _INDEX_COLUMN,
+    _build_table,
+    _compile_name_filter,
+    _console,
+    _echo_json,
+    _ensure_remote_loaded,
+    _get_context,
+    _json_text,
+    _render_auth_table,
+    _render_endpoint_table,
+)
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+    from ssh_manager.ssh_manager import SSHManager
+
+app = typer.Typer(
+    name="remote", no_args_is_help=True, help="Inspect remote repo configs", add_completion=False
+)
+
+
+def _sorted_matching_names(
+    manager: SSHManager, matcher: Optional[Callable[[str], object]]
+) -> Sequence[str]:
+    if matcher is None:
+        return manager.get_sorted_ssh_key_repo_server_names()
+    # Filter before sorting so only the matches pay for the sort.
+    return sorted(filter(matcher, manager.get_ssh_key_repo_config()))
+
+
+@app.command("list")
+def list_remote(
+    ctx: typer.Context,
+    pattern: Optional[List[str]] = typer.Option(
+        None,
+        "--pattern",
+        "-p",
+        help="Regex to search remote config names (re.search); repeat to match any.",
+    ),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show full remote config entries."),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON for scripting."),
+):
+    _ensure_remote_loaded(ctx)
+    cli_ctx = _get_context(ctx)
+    matcher = _compile_name_filter(pattern)
+    repo = cli_ctx.manager.get_ssh_key_repo_config()
+    names = _sorted_matching_names(cli_ctx.manager, matcher)
+
+    if json_output:
+        data = {name: repo[name] for name in names} if verbose else names
+        _echo_json(data)
+        return
+
+    console = _console()
+    rows = [(str(idx), name) for idx, name in enumerate(names)]
+    console.print(_build_table([_INDEX_COLUMN, ("config_name", "left", None)], rows))
+
+    if verbose:
+        from rich.console import Group
+        from rich.rule import Rule
+
+        # One render pass for every entry instead of a rule and a print each.
+        renderables: List[RenderableType] = []
+        for name in names:
+            renderables.append(Rule(name))
+            renderables.append(_json_text(repo[name]))
+        console.print(Group(*renderables))
+
+
+@app.command("show")
+def show_remote(
+    ctx: typer.Context,
+    config_name: str = typer.Argument(..., help="Remote config name to inspect."),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON for scripting."),
+):
+    _ensure_remote_loaded(ctx)
+    cli_ctx = _get_context(ctx)
+    config = cli_ctx.manager.get_ssh_key_repo_config().get(config_name)
+    if config is None:
+        typer.echo(
+            f"Remote config '{config_name}' not found. Run 'ssh-manager remote list' to see available names.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    endpoints = config.get("Endpoint", [])
+    auths = config.get("Authentication", [])
+    extra = config.get("ExtraConfig", [])
+
+    if json_output:
+        _echo_json(config)
+        return
+
+    console = _console()
+    console.print(f"Remote config: {config_name}")
+    console.print(_render_endpoint_table(endpoints))
+    console.print(_render_auth_table(auths))
+    if extra:
+        rows = [
+            (str(idx), item.get("Key", ""), item.get("Value", ""), item.get("Comment", "") or "")
+            for idx, item in enumerate(extra)
+        ]
+        columns = [_INDEX_COLUMN, ("Key", "left", None), ("Value", "left", None), ("Comment", "left", None)]
+        console.print(_build_table(columns, rows))
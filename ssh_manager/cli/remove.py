@@ -0,0 +1,66 @@
+"""``ssh-manager remove``: remove a host from the local ssh config."""
+
+from __future__ import annotations
+
+from typing import List
+
+import typer
+
+from ssh_manager.cli._common import CLIContext, _echo, _get_context
+
+app = typer.Typer(add_completion=False)
+
+
+def _resolve_target(cli_ctx: CLIContext, name_or_index: str) -> int:
+    target_idx = cli_ctx.name_index.get(name_or_index)
+
+    if target_idx is None:
+        # int() as before: surrounding whitespace, "+2" and "2_0" all count.
+        try:
+            idx_candidate = int(name_or_index)
+        except ValueError:
+            pass
+        else:
+            if 0 <= idx_candidate < len(cli_ctx.current_configs):
+                target_idx = idx_candidate
+
+    if target_idx is None:
+        typer.echo(
+            f"No host named/indexed '{name_or_index}' found in local ssh config.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    return target_idx
+
+
+@app.command()
+def remove(
+    ctx: typer.Context,
+    name_or_index: List[str] = typer.Argument(..., help="Host names or indices to remove."),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without writing files."),
+):
+    cli_ctx = _get_context(ctx)
+
+    # Indices refer to the listing before any removal; resolve them all up
+    # front so nothing is touched unless every target exists.
+    target_idxs = sorted({_resolve_target(cli_ctx, target) for target in name_or_index})
+    target_cfgs = [cli_ctx.current_configs[idx] for idx in target_idxs]
+    names = ", ".join(f"'{cfg.name}'" for cfg in target_cfgs)
+
+    if not yes:
+        if not typer.confirm(f"Remove {names} from ssh config?", default=False):
+            _echo("Canceled.")
+            return
+
+    if dry_run:
+        _echo(f"Dry run: would remove {names}.")
+        return
+
+    # Highest index first so the remaining indices stay valid; the config is
+    # rewritten once for the whole batch.
+    for idx, cfg in zip(reversed(target_idxs), reversed(target_cfgs)):
+        cli_ctx.manager.delete_identify_file(cfg)
+        cli_ctx.remove_config(idx)
+    cli_ctx.manager.write_ssh_config(cli_ctx.current_configs, backup=True)
+    _echo(f"Removed {names}.")
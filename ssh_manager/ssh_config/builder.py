@@ -1,24 +1,41 @@
-from typing import Dict, List
+from typing import Any, Callable, ClassVar, Dict, List
 import os
+import sys
+
+
+# Indent prefixes for the nesting depths the ssh config actually uses.
+_INDENTS = tuple("\t" * depth for depth in range(4))
+
+
+def get_indent(indent: int) -> str:
+    return _INDENTS[indent] if 0 <= indent < len(_INDENTS) else "\t" * indent
 
 
 def get_string_with_indent(indent: int, string: str) -> str:
-    return "\t" * indent + string
+    return get_indent(indent) + string
 
 
 def get_stripped_string_or_none(s) -> str | None:
+    # Parsed and JSON values are almost always str already; skip the str() call.
+    if isinstance(s, str):
+        return s.strip() if s else None
     return str(s).strip() if s else None
 
 
 def get_int_or_none(s) -> int | None:
+    if type(s) is int:
+        return s or None
     return int(s) if s else None
 
 
-def get_stripped_string_or_none_in_dict(d: Dict, key: str) -> str:
-    return get_stripped_string_or_none(d.get(key))
+def get_stripped_string_or_none_in_dict(d: Dict, key: str) -> str | None:
+    v = d.get(key)
+    if isinstance(v, str):
+        return v.strip() if v else None
+    return get_stripped_string_or_none(v)
 
 
-def get_int_or_none_in_dict(d: Dict, key: str) -> int:
+def get_int_or_none_in_dict(d: Dict, key: str) -> int | None:
     return get_int_or_none(d.get(key))
 
 
@@ -28,25 +45,53 @@ def get_identifier_file_path(
     # Extract the filename from original_identifier_file_path and place it under ssh_directory/server_name.
     return os.path.normpath(
         os.path.join(
-            ssh_directory, server_name, original_identifier_file_path.split("/")[-1]
+            ssh_directory, server_name, os.path.basename(original_identifier_file_path)
         )
     ).replace("\\", "/")
 
 
-def is_none_or_empty(s: str):
+def is_none_or_empty(s: str | None) -> bool:
     return s is None or s.strip() == ""
 
 
-class SSHEndpoint:
+class _Commented:
+    """Comment handling shared by the ssh config records."""
+
+    __slots__ = ("comment",)
+
+    def set_comment(self, comment):
+        self.comment = str(comment).strip()
+
+    def add_comment(self, comment: str):
+        self.comment = self.comment + " " + comment if self.comment else comment
+
+    def _gen_comment_str(self, prefix: str) -> str:
+        if is_none_or_empty(self.comment):
+            return ""
+        return f"{prefix}# {self.comment}\n"
+
+
+# add_config setters live at module level so the class-level _SETTERS tables
+# hold plain functions (which also keeps the module compilable with mypyc).
+def _set_endpoint_hostname(endpoint: "SSHEndpoint", value: str) -> None:
+    endpoint.hostname = value
 
-    def __init__(self, hostname=None, port=None, comment=None, dict: Dict = None):
+
+def _set_endpoint_port(endpoint: "SSHEndpoint", value: str) -> None:
+    endpoint.port = int(value)
+
+
+class SSHEndpoint(_Commented):
+    __slots__ = ("hostname", "port")
+
+    def __init__(self, hostname=None, port=None, comment=None, data: Dict | None = None):
         self.hostname = get_stripped_string_or_none(hostname)
         self.port = get_int_or_none(port)
         self.comment = get_stripped_string_or_none(comment)
-        if dict is not None:
-            self.hostname = get_stripped_string_or_none_in_dict(dict, "HostName")
-            self.port = get_int_or_none_in_dict(dict, "Port")
-            self.comment = get_stripped_string_or_none_in_dict(dict, "Comment")
+        if data is not None:
+            self.hostname = get_stripped_string_or_none_in_dict(data, "HostName")
+            self.port = get_int_or_none_in_dict(data, "Port")
+            self.comment = get_stripped_string_or_none_in_dict(data, "Comment")
 
     def set_hostname(self, hostname):
         self.hostname = str(hostname).strip()
@@ -54,47 +99,62 @@ class SSHEndpoint:
     def set_port(self, port):
         self.port = int(port)
 
-    def set_comment(self, comment):
-        self.comment = str(comment).strip()
-
-    def __gen_comment_str(self, indent: int) -> str:
-        if is_none_or_empty(self.comment):
-            return ""
-        return get_string_with_indent(indent, f"# {self.comment}\n")
-
-    def __gen_hostname_str(self, indent: int) -> str:
+    def __gen_hostname_str(self, prefix: str) -> str:
         if is_none_or_empty(self.hostname):
             return ""
-        return get_string_with_indent(indent, f"HostName {self.hostname}\n")
+        return f"{prefix}HostName {self.hostname}\n"
 
-    def __gen_port_str(self, indent: int) -> str:
+    def __gen_port_str(self, prefix: str) -> str:
         if self.port is None:
             return ""
-        return get_string_with_indent(indent, f"Port {self.port}\n")
+        return f"{prefix}Port {self.port}\n"
 
     def to_string(self, indent: int) -> str:
-        ret = (
-            self.__gen_comment_str(indent)
-            + self.__gen_hostname_str(indent)
-            + self.__gen_port_str(indent)
+        prefix = get_indent(indent)
+        return "".join(
+            (
+                self._gen_comment_str(prefix),
+                self.__gen_hostname_str(prefix),
+                self.__gen_port_str(prefix),
+            )
         )
-        return ret
 
-    def add_comment(self, comment: str):
-        self.comment = self.comment + " " + comment if self.comment else comment
+    def to_dict(self) -> Dict:
+        return {"hostname": self.hostname, "port": self.port, "comment": self.comment}
+
+    # ssh config key -> setter used by add_config.
+    _SETTERS: ClassVar[Dict[str, Callable[["SSHEndpoint", str], None]]] = {
+        "HostName": _set_endpoint_hostname,
+        "Port": _set_endpoint_port,
+    }
 
     def add_config(self, key: str, value: str, comment: str) -> bool:
-        if key == "HostName" or key == "Port":
-            if key == "HostName":
-                self.hostname = value
-            else:
-                self.port = int(value)
-            self.add_comment(comment)
-            return True
-        return False
+        setter = self._SETTERS.get(key)
+        if setter is None:
+            return False
+        setter(self, value)
+        self.add_comment(comment)
+        return True
+
+
+def _set_auth_user(auth: "SSHAuthentication", value: str) -> None:
+    auth.user = value
 
 
-class SSHAuthentication:
+def _set_auth_identity_file(auth: "SSHAuthentication", value: str) -> None:
+    # Parsed from the local config: the path is final, not repo-relative.
+    auth.identity_file = value
+    auth.original_identity_file = None
+
+
+class SSHAuthentication(_Commented):
+    __slots__ = (
+        "ssh_directory",
+        "server_name",
+        "user",
+        "original_identity_file",
+        "identity_file",
+    )
 
     def __init__(
         self,
@@ -103,19 +163,19 @@ class SSHAuthentication:
         user=None,
         identity_file=None,
         comment=None,
-        dict: Dict = None,
+        data: Dict | None = None,
     ):
         self.ssh_directory = ssh_directory
         self.server_name = server_name
         self.user = get_stripped_string_or_none(user)
         self.original_identity_file = get_stripped_string_or_none(identity_file)
         self.comment = get_stripped_string_or_none(comment)
-        if dict is not None:
-            self.user = get_stripped_string_or_none_in_dict(dict, "User")
+        if data is not None:
+            self.user = get_stripped_string_or_none_in_dict(data, "User")
             self.original_identity_file = get_stripped_string_or_none_in_dict(
-                dict, "IdentityFile"
+                data, "IdentityFile"
             )
-            self.comment = get_stripped_string_or_none_in_dict(dict, "Comment")
+            self.comment = get_stripped_string_or_none_in_dict(data, "Comment")
 
         self.identity_file = (
             get_identifier_file_path(
@@ -134,56 +194,59 @@ class SSHAuthentication:
             self.ssh_directory, self.server_name, self.original_identity_file
         )
 
-    def set_comment(self, comment):
-        self.comment = str(comment).strip()
-
-    def __gen_comment_str(self, indent: int) -> str:
-        if is_none_or_empty(self.comment):
-            return ""
-        return get_string_with_indent(indent, f"# {self.comment}\n")
-
-    def __gen_user_str(self, indent: int) -> str:
+    def __gen_user_str(self, prefix: str) -> str:
         if is_none_or_empty(self.user):
             return ""
-        return get_string_with_indent(indent, f"User {self.user}\n")
+        return f"{prefix}User {self.user}\n"
 
-    def __gen_identity_file_str(self, indent: int) -> str:
+    def __gen_identity_file_str(self, prefix: str) -> str:
         if is_none_or_empty(self.identity_file):
             return ""
-        return get_string_with_indent(indent, f"IdentityFile {self.identity_file}\n")
+        return f"{prefix}IdentityFile {self.identity_file}\n"
 
     def to_string(self, indent: int) -> str:
-        ret = (
-            self.__gen_comment_str(indent)
-            + self.__gen_user_str(indent)
-            + self.__gen_identity_file_str(indent)
+        prefix = get_indent(indent)
+        return "".join(
+            (
+                self._gen_comment_str(prefix),
+                self.__gen_user_str(prefix),
+                self.__gen_identity_file_str(prefix),
+            )
         )
-        return ret
 
-    def add_comment(self, comment: str):
-        self.comment = self.comment + " " + comment if self.comment else comment
+    def to_dict(self) -> Dict:
+        return {
+            "user": self.user,
+            "identity_file": self.identity_file,
+            "comment": self.comment,
+        }
+
+    # ssh config key -> setter used by add_config.
+    _SETTERS: ClassVar[Dict[str, Callable[["SSHAuthentication", str], None]]] = {
+        "User": _set_auth_user,
+        "IdentityFile": _set_auth_identity_file,
+    }
 
     def add_config(self, key: str, value: str, comment: str) -> bool:
-        if key == "User" or key == "IdentityFile":
-            if key == "User":
-                self.user = value
-            else:
-                self.identity_file = value
-                self.original_identity_file = None
-            self.add_comment(comment)
-            return True
-        return False
-
-
-class SSHExtraConfig:
-    def __init__(self, key=None, value=None, comment=None, dict: Dict = None):
+        setter = self._SETTERS.get(key)
+        if setter is None:
+            return False
+        setter(self, value)
+        self.add_comment(comment)
+        return True
+
+
+class SSHExtraConfig(_Commented):
+    __slots__ = ("key", "value")
+
+    def __init__(self, key=None, value=None, comment=None, data: Dict | None = None):
         self.key = get_stripped_string_or_none(key)
         self.value = get_stripped_string_or_none(value)
         self.comment = get_stripped_string_or_none(comment)
-        if dict is not None:
-            self.key = get_stripped_string_or_none_in_dict(dict, "Key")
-            self.value = get_stripped_string_or_none_in_dict(dict, "Value")
-            self.comment = get_stripped_string_or_none_in_dict(dict, "Comment")
+        if data is not None:
+            self.key = get_stripped_string_or_none_in_dict(data, "Key")
+            self.value = get_stripped_string_or_none_in_dict(data, "Value")
+            self.comment = get_stripped_string_or_none_in_dict(data, "Comment")
 
     def set_key(self, key):
         self.key = str(key).strip()
@@ -191,82 +254,118 @@ class SSHExtraConfig:
     def set_value(self, value):
         self.value = str(value).strip()
 
-    def set_comment(self, comment):
-        self.comment = str(comment).strip()
+    def to_string(self, indent: int) -> str:
+        return _format_extra_config(get_indent(indent), self.key, self.value, self.comment)
 
-    def __gen_comment_str(self, indent: int) -> str:
-        if is_none_or_empty(self.comment):
-            return ""
-        return get_string_with_indent(indent, f"# {self.comment}\n")
+    def to_dict(self) -> Dict:
+        return {"key": self.key, "value": self.value, "comment": self.comment}
 
-    def __gen_extra_config_str(self, indent: int) -> str:
-        if self.key is None:
-            raise ValueError("SSHExtraConfig key is None")
-        if self.value is None:
-            raise ValueError("SSHExtraConfig value is None")
-        return get_string_with_indent(indent, f"{self.key} {self.value}\n")
 
-    def to_string(self, indent: int) -> str:
-        ret = self.__gen_comment_str(indent) + self.__gen_extra_config_str(indent)
-        return ret
+def _format_extra_config(
+    prefix: str, key: str | None, value: str | None, comment: str | None
+) -> str:
+    # Shared by SSHExtraConfig.to_string and hosts rendering their raw
+    # ExtraConfig entries without building SSHExtraConfig objects.
+    if key is None:
+        raise ValueError("SSHExtraConfig key is None")
+    if value is None:
+        raise ValueError("SSHExtraConfig value is None")
+    if is_none_or_empty(comment):
+        return f"{prefix}{key} {value}\n"
+    return f"{prefix}# {comment}\n{prefix}{key} {value}\n"
+
+
+# Read-only stand-ins for hosts without an endpoint or auth block; never mutate.
+_EMPTY_ENDPOINT = SSHEndpoint()
+_EMPTY_AUTH = SSHAuthentication()
+
+# Keys that SSHHostConfig.add_config dispatches on, each mapped to its interned
+# self. The parser swaps freshly sliced keys for these so the _SETTERS lookups
+# match on identity instead of comparing string contents.
+_KNOWN_KEYS: Dict[str, str] = {
+    key: sys.intern(key) for key in (*SSHEndpoint._SETTERS, *SSHAuthentication._SETTERS)
+}
 
 
 class SSHHostConfigChoice:
+    __slots__ = ("ssh_mgr", "data", "endpoint_id", "auth_id")
 
-    def __init__(self, ssh_mgr, dict: Dict, endpoint_id: int = 0, auth_id: int = 0):
+    def __init__(self, ssh_mgr, data: Dict, endpoint_id: int = 0, auth_id: int = 0):
         self.ssh_mgr = ssh_mgr
-        self.dict = dict
+        self.data = data
         self.endpoint_id = endpoint_id
         self.auth_id = auth_id
 
 
-class SSHHostConfig:
+class SSHHostConfig(_Commented):
+    __slots__ = (
+        "name",
+        "endpoint",
+        "authentication",
+        "_extra_config",
+        "_extra_config_data",
+        "ssh_mgr",
+    )
 
     def __init__(
         self,
-        name: str = None,
+        name: str | None = None,
         comment=None,
-        choice: SSHHostConfigChoice = None,
+        choice: SSHHostConfigChoice | None = None,
     ):
         self.name = get_stripped_string_or_none(name)
         self.comment = get_stripped_string_or_none(comment)
-        self.endpoint: SSHEndpoint = SSHEndpoint()
-        self.authentication: SSHAuthentication = SSHAuthentication()
-        self.extra_config: List[SSHExtraConfig] = []
-        self.ssh_mgr = None
+        # Created on demand: hosts without an endpoint or auth block skip
+        # building (and later rendering) empty records.
+        self.endpoint: SSHEndpoint | None = None
+        self.authentication: SSHAuthentication | None = None
+        # ExtraConfig entries from a choice stay as raw dicts until something
+        # asks for extra_config; to_string formats them directly.
+        self._extra_config: List[SSHExtraConfig] | None = []
+        self._extra_config_data: List[Dict] | None = None
+        self.ssh_mgr: Any = None
         if choice is not None:
-            dict = choice.dict
+            data = choice.data
             self.ssh_mgr = choice.ssh_mgr
-            if "ServerName" in dict:
-                self.name = get_stripped_string_or_none_in_dict(dict, "ServerName")
-            if "Comment" in dict:
-                self.comment = get_stripped_string_or_none_in_dict(dict, "Comment")
-            if "Endpoint" in dict:
-                endpoints = dict["Endpoint"]
+            server_name = data.get("ServerName")
+            if server_name is not None:
+                self.name = get_stripped_string_or_none(server_name)
+            comment = data.get("Comment")
+            if comment is not None:
+                self.comment = get_stripped_string_or_none(comment)
+            endpoints = data.get("Endpoint")
+            if endpoints is not None:
                 if choice.endpoint_id >= len(endpoints):
                     raise ValueError(
                         f"SSHHostConfigChoice endpoint_id out of range: {choice.endpoint_id}"
                     )
-                self.endpoint = SSHEndpoint(dict=endpoints[choice.endpoint_id])
-            if "Authentication" in dict:
-                auths = dict["Authentication"]
+                self.endpoint = SSHEndpoint(data=endpoints[choice.endpoint_id])
+            auths = data.get("Authentication")
+            if auths is not None:
                 if choice.auth_id >= len(auths):
                     raise ValueError(
                         f"SSHHostConfigChoice auth_id out of range: {choice.auth_id}"
                     )
                 self.authentication = SSHAuthentication(
                     choice.ssh_mgr.get_ssh_directory(),
-                    self.name,
-                    dict=auths[choice.auth_id],
+                    self.name,  # type: ignore[arg-type]  # ServerName is required
+                    data=auths[choice.auth_id],
                 )
-            if "ExtraConfig" in dict:
-                self.extra_config = [
-                    SSHExtraConfig(dict=extra_config)
-                    for extra_config in dict["ExtraConfig"]
-                ]
-
-    def set_comment(self, comment: str):
-        self.comment = str(comment).strip()
+            extra_configs = data.get("ExtraConfig")
+            if extra_configs is not None:
+                self._extra_config = None
+                self._extra_config_data = extra_configs
+
+    @property
+    def extra_config(self) -> List[SSHExtraConfig]:
+        extra_config = self._extra_config
+        if extra_config is None:
+            extra_config = [
+                SSHExtraConfig(data=data) for data in self._extra_config_data or ()
+            ]
+            self._extra_config = extra_config
+            self._extra_config_data = None
+        return extra_config
 
     def set_endpoint(self, endpoint: SSHEndpoint):
         self.endpoint = endpoint
@@ -277,15 +376,16 @@ class SSHHostConfig:
     def add_extra_config(self, extra_config: SSHExtraConfig):
         self.extra_config.append(extra_config)
 
-    def __gen_comment_str(self, indent: int) -> str:
+    def _gen_comment_str(self, prefix: str) -> str:
+        # Unlike the nested records, a whitespace-only host comment is kept.
         if self.comment is None or len(self.comment) == 0:
             return ""
-        return get_string_with_indent(indent, f"# {self.comment}\n")
+        return f"{prefix}# {self.comment}\n"
 
-    def __gen_host_config_header_str(self, indent: int) -> str:
+    def __gen_host_config_header_str(self, prefix: str) -> str:
         if self.name is None:
             raise ValueError("SSHHostConfig name is None")
-        return get_string_with_indent(indent, f"Host {self.name}\n")
+        return f"{prefix}Host {self.name}\n"
 
     def __gen_endpoint_str(self, indent: int) -> str:
         if self.endpoint is None:
@@ -298,10 +398,23 @@ class SSHHostConfig:
         return self.authentication.to_string(indent + 1)
 
     def __gen_extra_config_str(self, indent: int) -> str:
-        ret = ""
-        for extra_config in self.extra_config:
-            ret += extra_config.to_string(indent + 1)
-        return ret
+        extra_config = self._extra_config
+        if extra_config is not None:
+            return "".join(
+                [extra.to_string(indent + 1) for extra in extra_config]
+            )
+        prefix = get_indent(indent + 1)
+        return "".join(
+            [
+                _format_extra_config(
+                    prefix,
+                    get_stripped_string_or_none_in_dict(data, "Key"),
+                    get_stripped_string_or_none_in_dict(data, "Value"),
+                    get_stripped_string_or_none_in_dict(data, "Comment"),
+                )
+                for data in self._extra_config_data or ()
+            ]
+        )
 
     def get_ssh_identity_file(self) -> str | None:
         if self.authentication is None:
@@ -319,19 +432,39 @@ class SSHHostConfig:
         )
 
     def to_string(self, indent: int) -> str:
-        return (
-            self.__gen_comment_str(indent)
-            + self.__gen_host_config_header_str(indent)
-            + self.__gen_endpoint_str(indent)
-            + self.__gen_authentication_str(indent)
-            + self.__gen_extra_config_str(indent)
+        prefix = get_indent(indent)
+        return "".join(
+            (
+                self._gen_comment_str(prefix),
+                self.__gen_host_config_header_str(prefix),
+                self.__gen_endpoint_str(indent),
+                self.__gen_authentication_str(indent),
+                self.__gen_extra_config_str(indent),
+            )
         )
 
+    def to_dict(self) -> Dict:
+        # ssh_mgr and the original identity file path are internal; keep the
+        # JSON view to what ends up in the ssh config.
+        return {
+            "name": self.name,
+            "comment": self.comment,
+            "endpoint": (self.endpoint or _EMPTY_ENDPOINT).to_dict(),
+            "authentication": (self.authentication or _EMPTY_AUTH).to_dict(),
+            "extra_config": [extra.to_dict() for extra in self.extra_config],
+        }
+
     def add_config(self, key: str, value: str, comment: str):
         value = value.strip("'\"")
-        if self.endpoint.add_config(key, value, comment):
+        if key in SSHEndpoint._SETTERS:
+            if self.endpoint is None:
+                self.endpoint = SSHEndpoint()
+            self.endpoint.add_config(key, value, comment)
             return
-        if self.authentication.add_config(key, value, comment):
+        if key in SSHAuthentication._SETTERS:
+            if self.authentication is None:
+                self.authentication = SSHAuthentication()
+            self.authentication.add_config(key, value, comment)
             return
         self.extra_config.append(SSHExtraConfig(key, value, comment))
 
@@ -1,6 +1,6 @@
 import re
-from typing import List, Tuple
-from ssh_manager.ssh_config.builder import SSHHostConfig
+from typing import List, Optional
+from ssh_manager.ssh_config.builder import _KNOWN_KEYS, SSHHostConfig
 
 # Define token types.
 TOKEN_TYPES = {
@@ -10,144 +10,128 @@ TOKEN_TYPES = {
     "WHITESPACE": r"\s+",  # Whitespace
 }
 
+_MANAGED_HEADER = "# This file is managed by ssh_manager"
 
-class SSHConfigLexer:
-    def __init__(self, source_code):
-        self.source_code = source_code
-        self.tokens = []
-        self.position = 0  # Current character index
-        self.line = 1  # Current line number
-        self.column = 1  # Current column number
-
-    def get_token(self):
-        """
-        Get the next token and update line/column counters.
-        """
-        if self.position >= len(self.source_code):
-            return None  # End of file
-
-        for token_type, pattern in TOKEN_TYPES.items():
-            regex = re.compile(pattern)
-            match = regex.match(self.source_code, self.position)
-            if match:
-                value = match.group(0)
-                self.position = match.end()  # Update current position
-
-                # Update line and column
-                lines = value.split("\n")  # Split into lines
-                if len(lines) > 1:
-                    # Multi-line token
-                    self.line += len(lines) - 1  # Increment line count
-                    self.column = len(lines[-1]) + 1  # New line column starts at 1
-                else:
-                    self.column += len(value)  # Increment column on current line
-
-                # Skip whitespace tokens
-                if token_type != "WHITESPACE":
-                    return (token_type, value, self.line, self.column)
-
-                # Recurse to skip whitespace
-                return self.get_token()
-
-        raise ValueError(
-            f"Unexpected character at position {self.position} (Line {self.line}, Column {self.column})"
-        )
-
-
-class SSHConfigParser:
-    def __init__(self, lexer):
-        self.lexer = lexer
-        self.current_token = None
-        self.next_token = None
-        self.get_next_token()
-        self.get_next_token()
-
-    def get_next_token(self):
-        self.current_token = self.next_token
-        self.next_token = self.lexer.get_token()
-        return self.current_token
-
-    def parse_host_head(self) -> str:
-        if self.current_token is None:
-            raise ValueError(f"Expected 'host', but got None")
-        if self.current_token[0] != "HOST":
-            raise ValueError(
-                f"Expected 'host', but got {self.current_token[0]} at line {self.current_token[2]}, column {self.current_token[3]}"
-            )
-        self.get_next_token()
-        if self.current_token is None:
-            raise ValueError(f"Expected host name, but got None")
-        if self.current_token[0] != "ITEM":
-            raise ValueError(
-                f"Expected host name, but got {self.current_token[0]} at line {self.current_token[2]}, column {self.current_token[3]}"
-            )
-        ret = self.current_token[1]
-        self.get_next_token()
-        return ret
-
-    def parse_kv(self) -> Tuple[str, str]:
-        if self.current_token is None:
-            raise ValueError(f"Expected key, but got None")
-        if self.next_token is None:
-            raise ValueError(f"Expected value, but got None")
-        if self.current_token[0] != "ITEM":
-            raise ValueError(
-                f"Expected key, but got {self.current_token[0]} at line {self.current_token[2]}, column {self.current_token[3]}"
-            )
-        if self.next_token[0] != "ITEM":
-            raise ValueError(
-                f"Expected value, but got {self.next_token[0]} at line {self.next_token[2]}, column {self.next_token[3]}"
-            )
-        ret = (self.current_token[1], self.next_token[1])
-        self.get_next_token()
-        self.get_next_token()
-        return ret
-
-    def parse_host_config(self) -> SSHHostConfig:
-        host_comment = ""
-        while True:
-            if self.current_token is None:
-                raise ValueError(f"Expected host config, but got None")
-            if self.current_token[0] == "COMMENT":
-                host_comment += self.current_token[1][1:] + " "
-                self.get_next_token()
+# States of the single-pass scanner in parse_ssh_config.
+_TOP = 0  # before the first host; the managed-by header is skipped here
+_HEAD = 1  # collecting the comments above a Host line
+_NAME = 2  # after Host, expecting the host name
+_BODY = 3  # inside a host, expecting a key, a comment or the next Host
+_VALUE = 4  # after a key, expecting its value
+
+
+def _where(source_code: str, offset: int) -> str:
+    line = source_code.count("\n", 0, offset) + 1
+    column = offset - source_code.rfind("\n", 0, offset)
+    return f"line {line}, column {column}"
+
+
+_WHITESPACE_REGEX = re.compile(TOKEN_TYPES["WHITESPACE"])
+_ITEM_REGEX = re.compile(TOKEN_TYPES["ITEM"])
+
+
+def _skip_whitespace(source_code: str, position: int) -> int:
+    match = _WHITESPACE_REGEX.match(source_code, position)
+    return match.end() if match else position
+
+
+def _scan_item(source_code: str, position: int) -> int:
+    match = _ITEM_REGEX.match(source_code, position)
+    return match.end() if match else position
+
+
+def _is_word_char(char: str) -> bool:
+    # What ``\b`` in the HOST pattern treats as a word character.
+    return char.isalnum() or char == "_"
+
+
+def parse_ssh_config(ssh_config_content: str) -> List[SSHHostConfig]:
+    """
+    Parse ``ssh_config_content`` into host configs.
+
+    Scans the source once with the TOKEN_TYPES tokens and builds the hosts
+    directly. Locations are only computed for errors.
+    """
+    source = ssh_config_content
+    ret: List[SSHHostConfig] = []
+    host_config: Optional[SSHHostConfig] = None
+    host_comment = ""
+    comment = ""
+    key = ""
+    state = _TOP
+    position = 0
+    length = len(source)
+    while position < length:
+        # The tokens of TOKEN_TYPES, picked by the first character so that
+        # comments and Host need no regex at all.
+        char = source[position]
+        if char == "#":
+            end = source.find("\n", position)
+            if end < 0:
+                end = length
+            token_type = "COMMENT"
+        elif char.isspace():
+            position = _skip_whitespace(source, position)
+            continue
+        elif source.startswith("Host", position) and (
+            position + 4 == length or not _is_word_char(source[position + 4])
+        ):
+            end = position + 4
+            token_type = "HOST"
+        else:
+            end = _scan_item(source, position)
+            token_type = "ITEM"
+        value = source[position:end]
+        position = end
+        if state == _VALUE:
+            if token_type != "ITEM":
+                raise ValueError(
+                    f"Expected value, but got {token_type} at {_where(source, position)}"
+                )
+            host_config.add_config(key, value, comment)  # type: ignore[union-attr]
+            comment = ""
+            state = _BODY
+        elif state == _BODY:
+            if token_type == "ITEM":
+                key = _KNOWN_KEYS.get(value, value)
+                state = _VALUE
+            elif token_type == "COMMENT":
+                comment += value[1:] + " "
+            else:
+                # A Host line ends the current host; comments directly above
+                # it were already consumed by the host being closed.
+                ret.append(host_config)  # type: ignore[arg-type]
+                comment = ""
+                state = _NAME
+        elif state == _NAME:
+            if token_type != "ITEM":
+                raise ValueError(
+                    f"Expected host name, but got {token_type} at {_where(source, position)}"
+                )
+            host_config = SSHHostConfig(value, host_comment)
+            host_comment = ""
+            state = _BODY
+        elif token_type == "COMMENT":
+            if state == _TOP and value == _MANAGED_HEADER:
                 continue
-            break
-        if self.current_token[0] != "HOST":
+            host_comment += value[1:] + " "
+            state = _HEAD
+        elif token_type == "HOST":
+            state = _NAME
+        else:
             raise ValueError(
-                f"Expected host config, but got {self.current_token[0]} at line {self.current_token[2]}, column {self.current_token[3]}"
+                f"Expected host config, but got {token_type} at {_where(source, position)}"
             )
-        host_name = self.parse_host_head()
-        host_config = SSHHostConfig(host_name, host_comment)
-        comment = ""
-        while True:
-            if self.current_token is None:
-                break
-            if self.current_token[0] == "COMMENT":
-                comment += self.current_token[1][1:] + " "
-                self.get_next_token()
-                continue
-            if self.current_token[0] == "HOST":
-                break
-            key, value = self.parse_kv()
-            host_config.add_config(key, value, comment)
-            comment = ""
 
-        return host_config
-
-    def parse(self) -> List[SSHHostConfig]:
-        ret = []
-        while True:
-            if self.current_token is None:
-                break
-            if self.current_token[0] == "COMMENT" and self.current_token[1] == "# This file is managed by ssh_manager":
-                self.get_next_token()
-                continue
-            ret.append(self.parse_host_config())
-        return ret
+    if state == _BODY:
+        ret.append(host_config)  # type: ignore[arg-type]
+    elif state == _HEAD:
+        raise ValueError("Expected host config, but got None")
+    elif state == _NAME:
+        raise ValueError("Expected host name, but got None")
+    elif state == _VALUE:
+        raise ValueError("Expected value, but got None")
+    return ret
 
 
-def parse_ssh_config(ssh_config_content: str) -> List[SSHHostConfig]:
-    lexer = SSHConfigLexer(ssh_config_content)
-    parser = SSHConfigParser(lexer)
-    return parser.parse()
+__all__ = ["parse_ssh_config"]
@@ -1,8 +1,11 @@
 import json
 import os
+import shlex
 import stat
+import time
 from datetime import datetime
-from typing import List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import git
 import ssh_manager.ssh_config.builder as builder
@@ -10,70 +13,231 @@ import ssh_manager.ssh_config.parser as parser
 from ssh_manager.utils.config import Config
 import shutil
 
+try:  # optional speedup, see the ``fast`` extra
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Files in the ssh directory that are never private keys.
+_NON_KEY_FILES = frozenset({"authorized_keys", "config", "known_hosts", "known_hosts.old"})
+
+
+# ssh expands %C to a 40-character hex hash; a Unix socket path must fit in
+# sun_path (104 bytes on macOS and the BSDs, 108 on Linux).
+_CONTROL_HASH_LEN = 40
+_MAX_SOCKET_PATH = 103
+
+
+# fdatasync skips the metadata flush; not every platform has it.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _expand_user(path: str) -> str:
+    return os.path.expanduser(path) if path.startswith("~") else path
+
+
+def _loads_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_synced(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        _fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:  # other filesystem, no hard link support, ...
+        shutil.copy2(src, dst)
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src to dst in the kernel; False if src ended before its size said."""
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    return False
+                remaining -= copied
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    return True
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy data and metadata like shutil.copy2, letting the kernel move the bytes."""
+    # Opening dst truncates it, so leave src == dst to copy2's SameFileError.
+    if not hasattr(os, "copy_file_range") or (
+        os.path.exists(dst) and os.path.samefile(src, dst)
+    ):
+        shutil.copy2(src, dst)
+        return
+    try:
+        complete = _copy_file_range(src, dst)
+    except OSError:  # e.g. EXDEV on older kernels, or an unsupported filesystem
+        complete = False
+    if not complete:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _write_atomic(path: str, data: bytes, backup_path: Optional[str] = None) -> None:
+    """Replace ``path`` with ``data`` via a synced temp file and os.replace.
+
+    An existing file is first kept at ``backup_path``, if given. The old file
+    is replaced rather than modified, so a hard link is as good as a copy.
+    The new file keeps the old one's permissions; a new file gets 0600.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    tmp_path = f"{path}.tmp"
+    _write_synced(tmp_path, data)
+    try:
+        # Set explicitly: the umask filters os.open's mode, and a leftover
+        # temp file keeps whatever mode it had.
+        os.chmod(tmp_path, mode)
+        if backup_path is not None and os.path.exists(path):
+            _link_or_copy(path, backup_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 class SSHManager:
+    # How long an ls-remote answer is trusted before asking the remote again.
+    LS_REMOTE_TTL = 30.0
 
     def __init__(self, config_path: Optional[str] = None):
         self.config = Config(config_path)
-        self.ssh_key_repo_config = None
+        # The config is fixed for the manager's lifetime, so resolve these once.
+        self._ssh_dir: str = self.config.data()["ssh_dir"]
+        self._ssh_config_path = os.path.normpath(
+            os.path.expanduser(os.path.join(self._ssh_dir, "config"))
+        ).replace("\\", "/")
+        self.ssh_key_repo_config: Optional[Dict[str, Dict[str, Any]]] = None
+        self._sorted_repo_names: Optional[Tuple[str, ...]] = None
+        self._repo_config_stamp: Optional[Tuple[int, int]] = None
+        # Hosts parsed from the ssh config, keyed by (mtime_ns, size).
+        self._parsed_config: List[builder.SSHHostConfig] = []
+        self._parsed_config_stamp: Optional[Tuple[int, int]] = None
+        self._repo: Optional[git.Repo] = None
+        # (ref, monotonic time, sha) of the last ls-remote.
+        self._ls_remote_cache: Optional[Tuple[str, float, Optional[str]]] = None
 
     def get_ssh_directory(self) -> str:
-        return self.config.data()["ssh_dir"]
+        return self._ssh_dir
 
     def get_abs_path_based_on_ssh_key_repo_config(self, relevant_path: str) -> str:
         return self.config.to_abs_path_based_on_local_repo(relevant_path)
 
     def get_ssh_config_path(self) -> str:
-        return os.path.normpath(
-            os.path.expanduser(os.path.join(self.get_ssh_directory(), "config"))
-        ).replace("\\", "/")
+        return self._ssh_config_path
 
     def get_ssh_key_list(self) -> List:
-        ignore = {"authorized_keys", "config", "known_hosts", "known_hosts.old"}
-        res = os.listdir(self.get_ssh_directory())
-        ret = []
-        for filename in res:
-            if os.path.basename(filename) in ignore or os.path.basename(
-                filename
-            ).endswith(".pub"):
-                continue
-            ret.append(filename)
-        return ret
+        with os.scandir(self.get_ssh_directory()) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name not in _NON_KEY_FILES
+                and not entry.name.endswith(".pub")
+                and entry.is_file()
+            ]
 
     def pull_ssh_key_repo(self):
         remote_repo = self.config.data()["ssh_key_remote_repo"]
-        local_repo = os.path.expanduser(self.config.data()["ssh_key_local_repo"])
-        env = self._build_git_environment(remote_repo)
+        local_repo = self.config.local_repo_abs_path
+        repo = self._open_ssh_key_repo(remote_repo, local_repo)
+
+        if not repo.remotes:
+            raise ValueError(f"No remotes configured for local repo: {local_repo}")
+        origin = repo.remotes.origin
+        current_url = origin.url
+        if current_url != remote_repo:
+            raise ValueError(
+                f"Mismatch repo url, local path {local_repo} url={current_url}, remote url={remote_repo}"
+            )
+
+        if not self._is_local_repo_up_to_date(repo):
+            origin.pull()
+
+        self.read_ssh_key_repo_config()
 
+    def _open_ssh_key_repo(self, remote_repo: str, local_repo: str) -> git.Repo:
+        """Open (or clone) the local key repo once and reuse it on later pulls."""
+        repo = self._repo
+        if repo is not None and os.path.isdir(repo.git_dir):
+            return repo
+
+        env = self._build_git_environment(remote_repo)
         if os.path.exists(local_repo):
             try:
                 repo = git.Repo(local_repo)
             except git.exc.InvalidGitRepositoryError as exc:
                 if os.path.isdir(local_repo) and not os.listdir(local_repo):
                     shutil.rmtree(local_repo)
-                    repo = git.Repo.clone_from(remote_repo, local_repo, env=env)
+                    repo = self._clone_ssh_key_repo(remote_repo, local_repo, env)
                 else:
                     raise ValueError(
                         f"Local repo path exists but is not a git repository: {local_repo}"
                     ) from exc
         else:
             os.makedirs(os.path.dirname(local_repo), exist_ok=True)
-            repo = git.Repo.clone_from(remote_repo, local_repo, env=env)
+            repo = self._clone_ssh_key_repo(remote_repo, local_repo, env)
 
         repo.git.update_environment(**env)
+        self._repo = repo
+        return repo
+
+    def _clone_ssh_key_repo(self, remote_repo: str, local_repo: str, env: dict) -> git.Repo:
+        # Only the checked-out files are ever read, so skip history and tags.
+        # Later pulls fetch just the new commits on top of this.
+        return git.Repo.clone_from(
+            remote_repo,
+            local_repo,
+            env=env,
+            multi_options=["--depth=1", "--single-branch", "--no-tags"],
+        )
+
+    def _is_local_repo_up_to_date(self, repo: git.Repo) -> bool:
+        """Whether the local checkout already has the remote's commit, per ls-remote."""
+        try:
+            local_sha = repo.head.commit.hexsha
+        except ValueError:  # no commits yet
+            return False
+        tracking = None if repo.head.is_detached else repo.active_branch.tracking_branch()
+        ref = f"refs/heads/{tracking.remote_head}" if tracking is not None else "HEAD"
 
-        if not repo.remotes:
-            raise ValueError(f"No remotes configured for local repo: {local_repo}")
-        origin = repo.remotes.origin
-        current_url = origin.url
-        if current_url != remote_repo:
-            raise ValueError(
-                f"Mismatch repo url, local path {local_repo} url={current_url}, remote url={remote_repo}"
-            )
-
-        origin.pull()
-
-        self.read_ssh_key_repo_config()
+        now = time.monotonic()
+        cached = self._ls_remote_cache
+        if cached is not None and cached[0] == ref and now - cached[1] < self.LS_REMOTE_TTL:
+            remote_sha = cached[2]
+        else:
+            try:
+                output = repo.git.ls_remote("origin", ref)
+            except git.exc.GitCommandError:
+                return False  # let pull() report the problem
+            remote_sha = str(output).split()[0] if output else None
+            self._ls_remote_cache = (ref, now, remote_sha)
+        return remote_sha == local_sha
 
     def _build_git_environment(self, remote_repo: str) -> dict:
         env = {
@@ -81,9 +245,21 @@ class SSHManager:
             "GIT_ASKPASS": "echo",
         }
         if remote_repo.startswith("git@") or remote_repo.startswith("ssh://"):
-            env["GIT_SSH_COMMAND"] = (
-                "ssh -o StrictHostKeyChecking=accept-new -o BatchMode=yes"
-            )
+            ssh_command = "ssh -o StrictHostKeyChecking=accept-new -o BatchMode=yes"
+            control_persist = self.config.data().get("ssh_control_persist")
+            if control_persist and os.name != "nt":
+                # Opt-in: share one connection between ls-remote, clone and
+                # pull, and keep the master alive for later invocations.
+                # %C is a fixed-length hash, so the socket path stays short.
+                control_path = os.path.join(
+                    os.path.expanduser(self.get_ssh_directory()), "cm-%C"
+                )
+                if len(control_path) - 2 + _CONTROL_HASH_LEN <= _MAX_SOCKET_PATH:
+                    ssh_command += (
+                        f" -o ControlMaster=auto -o ControlPersist={shlex.quote(str(control_persist))}"
+                        f" -o ControlPath={shlex.quote(control_path)}"
+                    )
+            env["GIT_SSH_COMMAND"] = ssh_command
         return env
 
 
@@ -91,17 +267,17 @@ class SSHManager:
         try:
             config = None
             path = self.config.data()["ssh_key_local_repo"] + "/config.json"
-            with open(
-                path,
-                "r",
-                encoding="utf-8",
-            ) as file:
-                config = json.load(file)
+            with open(path, "rb") as file:
+                config = _loads_json(file.read())
             if not config:
                 raise ValueError("Config file is empty")
 
-            config.sort(key=lambda x: x["ServerName"])
+            names = [server["ServerName"] for server in config]
+            already_sorted = all(a <= b for a, b in zip(names, names[1:]))
+            if not already_sorted:
+                config.sort(key=lambda x: x["ServerName"])
 
+            repo_files = self._list_ssh_key_repo_files()
             for server in config:
                 if not server["ServerName"]:
                     raise ValueError("Server name is empty")
@@ -115,19 +291,20 @@ class SSHManager:
                                     identity_file
                                 )
                             )
-                            if not os.path.exists(identity_file):
+                            # The listing misses files outside the repo or
+                            # reached through symlinks; stat those instead.
+                            if identity_file not in repo_files and not os.path.exists(
+                                identity_file
+                            ):
                                 raise ValueError(
                                     f"Identity file {identity_file} not found"
                                 )
 
-            shutil.copy2(path, path + ".bak")
-
-            with open(
-                path,
-                "w",
-                encoding="utf-8",
-            ) as file:
-                json.dump(config, file, indent=4)
+            # Nothing to rewrite when the entries are already in order.
+            if not already_sorted:
+                _write_atomic(
+                    path, json.dumps(config, indent=4).encode("utf-8"), path + ".bak"
+                )
 
         except Exception as e:
             print(f"Failed to check ssh key repo config: {e}")
@@ -136,33 +313,71 @@ class SSHManager:
         print(f"Success to check ssh key repo config")
         return True
 
+    def _list_ssh_key_repo_files(self) -> Set[str]:
+        """Every file under the local key repo, as normalized absolute paths."""
+        files: Set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(self.config.local_repo_abs_path):
+            if ".git" in dirnames:
+                dirnames.remove(".git")
+            dirpath = dirpath.replace("\\", "/")
+            files.update(f"{dirpath}/{filename}" for filename in filenames)
+        return files
+
     def read_ssh_key_repo_config(self):
-        with open(
-            self.config.data()["ssh_key_local_repo"] + "/config.json",
-            "r",
-            encoding="utf-8",
-        ) as file:
-            config = json.load(file)
-            self.ssh_key_repo_config = {}
-            for server in config:
-                self.ssh_key_repo_config[server["ServerName"]] = server
+        path = self.config.data()["ssh_key_local_repo"] + "/config.json"
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        # A pull that changed nothing leaves the file alone; keep what we have.
+        if stamp == self._repo_config_stamp and self.ssh_key_repo_config is not None:
+            return
+        with open(path, "rb") as file:
+            config = _loads_json(file.read())
+        self.ssh_key_repo_config = {server["ServerName"]: server for server in config}
+        self._sorted_repo_names = None
+        self._repo_config_stamp = stamp
 
     def parse_current_ssh_config(self):
-        if not os.path.exists(self.get_ssh_config_path()):
+        path = self.get_ssh_config_path()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return []
-        with open(self.get_ssh_config_path(), "r", encoding="utf-8") as file:
-            return parser.parse_ssh_config(file.read())
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._parsed_config_stamp:
+            with open(path, "rb") as file:
+                content = file.read().decode("utf-8")
+            if "\r" in content:  # same newlines as reading in text mode
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            self._parsed_config = parser.parse_ssh_config(content)
+            self._parsed_config_stamp = stamp
+        # Callers add and remove hosts on the list they get back.
+        return list(self._parsed_config)
+
+    def get_ssh_key_repo_config(self) -> Dict[str, Dict[str, Any]]:
+        if self.ssh_key_repo_config is None:
+            raise ValueError(
+                "ssh key repo config is not loaded; call read_ssh_key_repo_config first"
+            )
+        return self.ssh_key_repo_config
 
     def get_ssh_key_repo_server_names(self) -> List[str]:
-        names = list(self.ssh_key_repo_config.keys())
+        names = list(self.get_ssh_key_repo_config().keys())
         return names
 
+    def get_sorted_ssh_key_repo_server_names(self) -> Tuple[str, ...]:
+        # Sorted on first use and reset by read_ssh_key_repo_config; a tuple
+        # so callers can share it safely.
+        if self._sorted_repo_names is None:
+            self._sorted_repo_names = tuple(sorted(self.get_ssh_key_repo_config()))
+        return self._sorted_repo_names
+
     def generate_ssh_config(
         self, server_name: str, endpoint_id: int = 0, auth_id: int = 0
     ) -> builder.SSHHostConfig:
-        if server_name not in self.ssh_key_repo_config:
+        repo_config = self.get_ssh_key_repo_config()
+        if server_name not in repo_config:
             raise ValueError(f"Unknown server name: {server_name}")
-        server = self.ssh_key_repo_config[server_name]
+        server = repo_config[server_name]
 
         choice = builder.SSHHostConfigChoice(self, server, endpoint_id, auth_id)
         ssh_host_config = builder.SSHHostConfig(choice=choice)
@@ -182,72 +397,61 @@ class SSHManager:
 
     def render_ssh_config(self, configs: List[builder.SSHHostConfig]) -> str:
         """Render a complete ssh config string sorted by host name."""
-        sorted_configs = sorted(configs, key=lambda cfg: cfg.name or "")
-        lines = ["# This file is managed by ssh_manager"]
-        for cfg in sorted_configs:
-            lines.append("")
-            lines.append(cfg.to_string(0).rstrip())
-        lines.append("")
-        return "\n".join(lines)
+        keyed = [(cfg.name or "", cfg) for cfg in configs]
+        keyed.sort(key=itemgetter(0))
+        blocks = ["# This file is managed by ssh_manager"]
+        blocks.extend([cfg.to_string(0).rstrip() for _, cfg in keyed])
+        return "\n\n".join(blocks) + "\n"
 
     def write_ssh_config(self, configs: List[builder.SSHHostConfig], backup: bool = True):
         ssh_config = self.get_ssh_config_path()
         os.makedirs(os.path.dirname(ssh_config), exist_ok=True)
 
-        content = self.render_ssh_config(configs)
-        tmp_path = f"{ssh_config}.tmp"
-
-        with open(tmp_path, "w", encoding="utf-8") as file:
-            file.write(content)
-            file.flush()
-            os.fsync(file.fileno())
-
-        if backup and os.path.exists(ssh_config):
+        data = self.render_ssh_config(configs).encode("utf-8")
+        backup_path = None
+        if backup:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = f"{ssh_config}.bak.{timestamp}"
-            shutil.copy2(ssh_config, backup_path)
-
-        try:
-            os.replace(tmp_path, ssh_config)
-        except Exception:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-            raise
+        _write_atomic(ssh_config, data, backup_path)
 
     def copy_identify_file(self, ssh_host_config: builder.SSHHostConfig):
         original_identify_file = ssh_host_config.get_ssh_original_identity_file()
         if original_identify_file is None:
             return
-        original_identify_file = os.path.expanduser(original_identify_file)
-
-        identify_file = os.path.expanduser(ssh_host_config.get_ssh_identity_file())
-        assert (original_identify_file is None) == (
-            identify_file is None
-        ), "identify_file and original_identify_file should be both None or not None"
-
-        if original_identify_file is not None:
-            # Ensure identify_file directory exists; create it if needed.
-            if not os.path.exists(os.path.dirname(identify_file)):
-                os.makedirs(os.path.dirname(identify_file), exist_ok=True)
-            # Ensure original_identify_file exists; otherwise raise an exception.
-            if not os.path.exists(original_identify_file):
-                raise ValueError(
-                    f"original_identify_file not exists: {original_identify_file}"
-                )
-            # Copy file and set permissions.
-            shutil.copy2(original_identify_file, identify_file)
-            os.chmod(identify_file, stat.S_IRUSR | stat.S_IWUSR)
+        original_identify_file = _expand_user(original_identify_file)
+        # Set together with the original path by SSHAuthentication.
+        identify_file = ssh_host_config.get_ssh_identity_file()
+        assert identify_file is not None
+        identify_file = _expand_user(identify_file)
+
+        # Check the original first so a missing one leaves no empty directory.
+        if not os.path.exists(original_identify_file):
+            raise ValueError(
+                f"original_identify_file not exists: {original_identify_file}"
+            )
+        # Ensure identify_file directory exists; create it if needed.
+        os.makedirs(os.path.dirname(identify_file), exist_ok=True)
+        # Copy file and set permissions.
+        _fast_copy(original_identify_file, identify_file)
+        os.chmod(identify_file, stat.S_IRUSR | stat.S_IWUSR)
 
     def append_ssh_host_config(self, ssh_host_config: builder.SSHHostConfig):
-        self.copy_identify_file(ssh_host_config)
+        self.append_ssh_host_configs([ssh_host_config])
+
+    def append_ssh_host_configs(self, ssh_host_configs: List[builder.SSHHostConfig]):
+        """Append host blocks to the ssh config with a single atomic rewrite."""
+        for ssh_host_config in ssh_host_configs:
+            self.copy_identify_file(ssh_host_config)
         ssh_config = self.get_ssh_config_path()
-        if not os.path.exists(ssh_config):
+        try:
+            with open(ssh_config, "rb") as file:
+                parts = [file.read()]
+        except FileNotFoundError:
             os.makedirs(os.path.dirname(ssh_config), exist_ok=True)
-            with open(ssh_config, "w", encoding="utf-8") as file:
-                file.write("# This file is managed by ssh_manager\n")
-                print("Config not exists, created")
-
-        with open(ssh_config, "a", encoding="utf-8") as file:
-            file.write("\n\n")
-            file.write(ssh_host_config.to_string(0))
-            # print("Config updated")
+            parts = [b"# This file is managed by ssh_manager\n"]
+            print("Config not exists, created")
+
+        for ssh_host_config in ssh_host_configs:
+            parts.append(b"\n\n")
+            parts.append(ssh_host_config.to_string(0).encode("utf-8"))
+        _write_atomic(ssh_config, b"".join(parts))
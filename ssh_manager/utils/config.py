@@ -1,17 +1,44 @@
 import json
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 from ssh_manager.utils import paths
 
 PathLike = Union[str, Path]
 
+# %{DATA_ROOT} and $VAR / ${VAR} (as posixpath.expandvars finds them), so one
+# re.sub does what expand_data_root and expandvars did in two passes.
+_EXPAND_RE = re.compile(
+    re.escape(paths._DATA_ROOT_TOKEN) + r"|\$(?:\w+|\{[^}]*\})", re.ASCII
+)
+
+
+def _expand_match(match: "re.Match[str]") -> str:
+    text = match.group()
+    if text == paths._DATA_ROOT_TOKEN:
+        return str(paths.DATA_ROOT)
+    return os.path.expandvars(text)
+
+
+def _expand_text(text: str) -> str:
+    if "%" not in text and "~" not in text and "$" not in text:
+        return text
+    # The chained calls feed each step's output into the next (e.g. $VAR
+    # inside an expanded ~ or data root); keep them where that can matter,
+    # and on Windows, where expandvars also knows %VAR%.
+    if (
+        os.name == "nt"
+        or text[0] == "~"
+        or ("$" in text and paths._DATA_ROOT_TOKEN in text)
+    ):
+        return os.path.expandvars(os.path.expanduser(str(paths.expand_data_root(text))))
+    return _EXPAND_RE.sub(_expand_match, text)
+
 
 def _normalize_path(base: Path, value: PathLike) -> str:
-    expanded = paths.expand_data_root(value)
-    expanded = os.path.expandvars(os.path.expanduser(str(expanded)))
-    candidate = Path(expanded)
+    candidate = Path(_expand_text(str(value)))
     if not candidate.is_absolute():
         candidate = (base / candidate).resolve()
     else:
@@ -20,14 +47,26 @@ def _normalize_path(base: Path, value: PathLike) -> str:
 
 
 def _expand_values(value: Any) -> Any:
-    if isinstance(value, dict):
-        return {key: _expand_values(val) for key, val in value.items()}
-    if isinstance(value, list):
-        return [_expand_values(item) for item in value]
+    """Expand every string in a freshly loaded JSON tree, in place."""
     if isinstance(value, (str, Path)):
-        expanded = paths.expand_data_root(value)
-        expanded = os.path.expandvars(os.path.expanduser(str(expanded)))
-        return expanded
+        return _expand_text(str(value))
+    stack = [value]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items: Any = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
+        else:
+            continue
+        for key, item in items:
+            if isinstance(item, (dict, list)):
+                stack.append(item)
+            elif isinstance(item, (str, Path)):
+                expanded = _expand_text(str(item))
+                # Replacing the value of an existing key is fine mid-iteration.
+                if expanded is not item:
+                    container[key] = expanded
     return value
 
 
@@ -36,6 +75,9 @@ class Config:
     def __init__(self, config_file_path: PathLike | None = None):
         self.config_path = self._resolve_config_path(config_file_path)
         self.config_abs_path = self.config_path.parent
+        # resolve() stats every component and identity files repeat a lot;
+        # results are kept per Config, which sees one environment.
+        self._normalized: Dict[Tuple[Path, str], str] = {}
 
         with open(self.config_path, "r", encoding="utf-8") as file:
             raw_config: Dict[str, Any] = json.load(file)
@@ -45,6 +87,7 @@ class Config:
             self.config_abs_path, self.config_data["ssh_key_local_repo"]
         )
         self.config_data["ssh_key_local_repo"] = self.local_repo_abs_path
+        self._local_repo_path = Path(self.local_repo_abs_path)
 
     def _resolve_config_path(self, config_file_path: PathLike | None) -> Path:
         if config_file_path is None:
@@ -63,11 +106,18 @@ class Config:
             raise FileNotFoundError(f"Config file not found at {candidate}")
         return candidate
 
+    def _normalize_cached(self, base: Path, value: str) -> str:
+        key = (base, value)
+        normalized = self._normalized.get(key)
+        if normalized is None:
+            normalized = self._normalized[key] = _normalize_path(base, value)
+        return normalized
+
     def to_abs_path_based_on_config(self, relevant_path: str) -> str:
-        return _normalize_path(self.config_abs_path, relevant_path)
+        return self._normalize_cached(self.config_abs_path, relevant_path)
 
     def to_abs_path_based_on_local_repo(self, relevant_path: str) -> str:
-        return _normalize_path(Path(self.local_repo_abs_path), relevant_path)
+        return self._normalize_cached(self._local_repo_path, relevant_path)
 
     def data(self):
         return self.config_data
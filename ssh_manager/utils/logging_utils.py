@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
 import threading
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -19,6 +21,13 @@ def _now() -> datetime:
     return _now_func()
 
 
+def _timestamp() -> float:
+    # Cheaper than _now() on the hot path, but still honours a patched _now_func.
+    if _now_func == datetime.now:
+        return time.time()
+    return _now_func().timestamp()
+
+
 class DailySymlinkFileHandler(logging.Handler):
     """File handler that rolls to a new dated file automatically at midnight.
 
@@ -46,6 +55,9 @@ class DailySymlinkFileHandler(logging.Handler):
         self._lock = threading.RLock()
         self._file_handler: Optional[logging.FileHandler] = None
         self._current_date: Optional[str] = None
+        # POSIX timestamp of the next local midnight; emit() only re-checks
+        # the date once this has passed.
+        self._next_rollover = 0.0
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._rotate_if_needed()
 
@@ -61,10 +73,14 @@ class DailySymlinkFileHandler(logging.Handler):
             self._file_handler.setFormatter(fmt)
 
     def emit(self, record: logging.LogRecord) -> None:  # noqa: D401
+        # Always under the lock, so close() or a rollover in another thread
+        # cannot swap or close the handler mid-write; before the next local
+        # midnight only the timestamp is compared.
         with self._lock:
-            self._rotate_if_needed()
-            if not self._file_handler:
-                return
+            if self._file_handler is None or _timestamp() >= self._next_rollover:
+                self._rotate_if_needed()
+                if not self._file_handler:
+                    return
             self._file_handler.emit(record)
 
     def close(self) -> None:  # noqa: D401
@@ -75,7 +91,10 @@ class DailySymlinkFileHandler(logging.Handler):
         super().close()
 
     def _rotate_if_needed(self) -> None:
-        today_label = _now().strftime("%Y-%m-%d")
+        now = _now()
+        today_label = now.strftime("%Y-%m-%d")
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._next_rollover = (midnight + timedelta(days=1)).timestamp()
         if self._current_date == today_label and self._file_handler:
             return
         if self._file_handler:
@@ -132,16 +151,31 @@ def _cleanup_old_logs(
         return
     cutoff = _now().date() - timedelta(days=max(1, retention_days) - 1)
     prefix = f"{stem}-"
-    for candidate in log_dir.glob(f"{stem}-*.log"):
-        if candidate == keep_file:
-            continue
-        suffix = candidate.stem[len(prefix) :]
-        try:
-            file_date = datetime.strptime(suffix, "%Y-%m-%d").date()
-        except ValueError:
-            continue
-        if file_date < cutoff:
-            candidate.unlink(missing_ok=True)
+    keep_name = keep_file.name
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(".log")) or name == keep_name:
+                continue
+            file_date = _parse_log_date(name[len(prefix) : -4])
+            if file_date is not None and file_date < cutoff:
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def _parse_log_date(label: str) -> date | None:
+    """Parse the ``YYYY-MM-DD`` label of a daily log file without strptime."""
+    if len(label) != 10 or label[4] != "-" or label[7] != "-":
+        return None
+    year, month, day = label[:4], label[5:7], label[8:]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 def _update_symlink(link_path: Path, newest_log: Path) -> None:
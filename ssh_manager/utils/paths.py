@@ -44,14 +44,15 @@ def _find_data_root() -> Path:
     candidate = Path.cwd().resolve()
     home_candidate = Path.home().resolve()
     for ancestor in (candidate, *candidate.parents, home_candidate):
-        marker = ancestor / _DATA_MARKER
-        if marker.is_file():
+        if _has_data_marker_file(ancestor):
             return ancestor
-        for subdir in ancestor.iterdir():
-            if not subdir.is_dir():
-                continue
-            if _has_data_marker_file(subdir):
-                return subdir
+        # One scandir per ancestor; the dirent type saves a stat per child.
+        with os.scandir(ancestor) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdir = Path(entry.path)
+                    if _has_data_marker_file(subdir):
+                        return subdir
     raise RuntimeError(
         f"Unable to locate data root using {_DATA_MARKER}; set {_DATA_ROOT_ENV} to override"
     )
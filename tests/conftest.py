@@ -0,0 +1,31 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# ssh_manager.utils.paths locates the data root at import time, so point it
+# at a scratch directory before any test module imports the package.
+_DATA_ROOT = Path(tempfile.mkdtemp(prefix="ssh-manager-tests-"))
+(_DATA_ROOT / "SSH_CONFIG_DATA_ROOT").touch()
+os.environ["SSH_CONFIG_DATA_ROOT"] = str(_DATA_ROOT)
+
+
+@pytest.fixture
+def manager_config(tmp_path: Path) -> Path:
+    """A manager config.json whose ssh_dir and key repo live under tmp_path."""
+    ssh_dir = tmp_path / "ssh"
+    ssh_dir.mkdir()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "ssh_key_remote_repo": str(tmp_path / "remote"),
+                "ssh_key_local_repo": str(tmp_path / "repos" / "keys"),
+                "ssh_dir": str(ssh_dir),
+            }
+        ),
+        encoding="utf-8",
+    )
+    return config_path
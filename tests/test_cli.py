@@ -0,0 +1,112 @@
+import json
+import re
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from ssh_manager.cli import app
+from ssh_manager.cli._common import _compile_name_filter
+
+HOSTS = """# This file is managed by ssh_manager
+Host alpha
+\tHostName alpha.example.com
+
+Host beta
+\tHostName beta.example.com
+
+Host gamma
+\tHostName gamma.example.com
+"""
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def ssh_config(manager_config):
+    path = manager_config.parent / "ssh" / "config"
+    path.write_text(HOSTS, encoding="utf-8")
+    return path
+
+
+def _invoke(manager_config, *args, input=None):
+    return runner.invoke(app, ["--config", str(manager_config), *args], input=input)
+
+
+def _host_names(path):
+    return re.findall(r"^Host (\S+)", path.read_text(encoding="utf-8"), re.M)
+
+
+def test_remove_several_hosts_with_one_prompt(manager_config, ssh_config):
+    result = _invoke(manager_config, "remove", "alpha", "2", input="y\n")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("from ssh config?") == 1
+    assert "Remove 'alpha', 'gamma' from ssh config?" in result.output
+    assert "Removed 'alpha', 'gamma'." in result.output
+    assert _host_names(ssh_config) == ["beta"]
+    backups = list(ssh_config.parent.glob("config.bak.*"))
+    assert len(backups) == 1
+    assert backups[0].read_text(encoding="utf-8") == HOSTS
+
+
+def test_remove_cancel_leaves_the_config_alone(manager_config, ssh_config):
+    result = _invoke(manager_config, "remove", "alpha", "beta", input="n\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Canceled." in result.output
+    assert ssh_config.read_text(encoding="utf-8") == HOSTS
+
+
+def test_remove_unknown_target_changes_nothing(manager_config, ssh_config):
+    result = _invoke(manager_config, "remove", "alpha", "nope", "--yes")
+
+    assert result.exit_code == 1
+    assert ssh_config.read_text(encoding="utf-8") == HOSTS
+
+
+def test_remove_accepts_indices_with_whitespace(manager_config, ssh_config):
+    result = _invoke(manager_config, "remove", " 1 ", "--yes")
+
+    assert result.exit_code == 0, result.output
+    assert _host_names(ssh_config) == ["alpha", "gamma"]
+
+
+def test_local_list_with_repeated_patterns(manager_config, ssh_config):
+    result = _invoke(manager_config, "local", "list", "-p", "^al", "-p", "(?i)GAM", "--json")
+
+    assert result.exit_code == 0, result.output
+    assert [host["name"] for host in json.loads(result.output)] == ["alpha", "gamma"]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["x"],
+        ["^a", "b$"],
+        ["a", "(?i)B"],
+        ["(?i)(?m)x", "y"],
+        ["(?x) a # comment", "b"],
+        ["(a)\\1", "(b)\\1"],
+        ["(?P<n>a)(?P=n)", "(?P<n>b)"],
+        ["\\\\1", "(a)"],
+    ],
+)
+def test_combined_patterns_match_like_separate_searches(patterns):
+    names = ["a", "aa", "A", "b", "bb", "B", "x", "X", "y", "\\1", "ab", ""]
+    matcher = _compile_name_filter(patterns)
+    compiled = [re.compile(pattern) for pattern in patterns]
+
+    assert [name for name in names if matcher(name)] == [
+        name for name in names if any(pattern.search(name) for pattern in compiled)
+    ]
+
+
+def test_no_patterns_means_no_filter():
+    assert _compile_name_filter(None) is None
+    assert _compile_name_filter(["", ""]) is None
+
+
+def test_invalid_pattern_is_a_bad_parameter():
+    with pytest.raises(typer.BadParameter):
+        _compile_name_filter(["a", "("])
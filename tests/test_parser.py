@@ -0,0 +1,78 @@
+import pytest
+
+from ssh_manager.ssh_config.parser import parse_ssh_config
+
+SOURCE = """# This file is managed by ssh_manager
+# jump box
+# second line
+Host bastion
+    HostName bastion.example.com
+    Port 2222
+    # login user
+    User admin
+    IdentityFile ~/.ssh/bastion/id_ed25519
+    ServerAliveInterval 30
+
+Host db-*
+    HostName 10.0.0.5
+    ProxyJump bastion
+    # trailing comment
+"""
+
+# Rendered by the original lexer/parser pair.
+EXPECTED = [
+    (
+        "# jump box  second line\n"
+        "Host bastion\n"
+        "\tHostName bastion.example.com\n"
+        "\tPort 2222\n"
+        "\t#  login user  \n"
+        "\tUser admin\n"
+        "\tIdentityFile ~/.ssh/bastion/id_ed25519\n"
+        "\tServerAliveInterval 30\n"
+    ),
+    "Host db-*\n\tHostName 10.0.0.5\n\tProxyJump bastion\n",
+]
+
+
+def test_parse_renders_like_the_original_parser():
+    configs = parse_ssh_config(SOURCE)
+    assert [cfg.name for cfg in configs] == ["bastion", "db-*"]
+    assert [cfg.to_string(0) for cfg in configs] == EXPECTED
+
+
+def _settings(rendered):
+    # Comment text picks up padding on every render, so compare the rest.
+    return [line for line in rendered.splitlines() if not line.lstrip().startswith("#")]
+
+
+def test_rendered_config_parses_back_to_the_same_hosts():
+    rendered = "\n".join(cfg.to_string(0) for cfg in parse_ssh_config(SOURCE))
+    reparsed = parse_ssh_config(rendered)
+    assert [_settings(cfg.to_string(0)) for cfg in reparsed] == [
+        _settings(expected) for expected in EXPECTED
+    ]
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["", "# This file is managed by ssh_manager\n"],
+)
+def test_empty_configs(source):
+    assert parse_ssh_config(source) == []
+
+
+@pytest.mark.parametrize(
+    ("source", "message"),
+    [
+        ("Host", "Expected host name, but got None"),
+        ("Host a\n  HostName", "Expected value, but got None"),
+        ("foo bar", "Expected host config, but got ITEM at line 1, column 4"),
+        ("# only a comment\n", "Expected host config, but got None"),
+        ("Host a\n Hostname Host", "Expected value, but got HOST at line 2, column 15"),
+    ],
+)
+def test_errors_match_the_original_parser(source, message):
+    with pytest.raises(ValueError) as excinfo:
+        parse_ssh_config(source)
+    assert str(excinfo.value) == message
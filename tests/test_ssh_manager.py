@@ -0,0 +1,81 @@
+import os
+import shutil
+import stat
+
+import pytest
+
+from ssh_manager.ssh_manager import SSHManager, _fast_copy
+
+HEADER = b"# This file is managed by ssh_manager\n"
+
+
+def _mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def manager(manager_config):
+    return SSHManager(str(manager_config))
+
+
+@pytest.fixture
+def ssh_config(manager_config):
+    return manager_config.parent / "ssh" / "config"
+
+
+def test_write_creates_a_private_file(manager, ssh_config):
+    manager.write_ssh_config([])
+
+    assert ssh_config.read_bytes() == HEADER
+    assert _mode(ssh_config) == 0o600
+    assert sorted(os.listdir(ssh_config.parent)) == ["config"]
+
+
+def test_write_keeps_a_backup_and_the_mode(manager, ssh_config):
+    ssh_config.write_bytes(b"old\n")
+    os.chmod(ssh_config, 0o644)
+
+    manager.write_ssh_config([])
+
+    assert ssh_config.read_bytes() == HEADER
+    assert _mode(ssh_config) == 0o644
+    backups = list(ssh_config.parent.glob("config.bak.*"))
+    assert len(backups) == 1
+    assert backups[0].read_bytes() == b"old\n"
+
+
+def test_write_ignores_a_leftover_temp_file(manager, ssh_config):
+    ssh_config.write_bytes(b"old\n")
+    os.chmod(ssh_config, 0o640)
+    leftover = ssh_config.parent / "config.tmp"
+    leftover.write_bytes(b"stale stale stale\n")
+    os.chmod(leftover, 0o666)
+
+    manager.write_ssh_config([], backup=False)
+
+    assert ssh_config.read_bytes() == HEADER
+    assert _mode(ssh_config) == 0o640
+    assert not leftover.exists()
+
+
+def test_fast_copy_onto_itself_keeps_the_file(tmp_path):
+    key = tmp_path / "id_ed25519"
+    key.write_bytes(b"secret\n")
+
+    with pytest.raises(shutil.SameFileError):
+        _fast_copy(str(key), str(key))
+
+    assert key.read_bytes() == b"secret\n"
+
+
+def test_fast_copy_copies_data_and_mode(tmp_path):
+    src = tmp_path / "src"
+    src.write_bytes(b"x" * 100_000)
+    os.chmod(src, 0o640)
+    dst = tmp_path / "dst"
+    dst.write_bytes(b"longer old content" * 10_000)
+
+    _fast_copy(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert _mode(dst) == 0o640